@@ -1,53 +1,62 @@
 #!/usr/bin/env python3
+import asyncio
+import concurrent.futures
+import functools
 import time
 import json
 import argparse
+import importlib.util
+import logging
 import os
 import platform
+import shutil
+import signal
+import subprocess
+import sqlite3
 import sys
-from datetime import datetime
 
-# Fix import for FordPassAPI - handle different module naming conventions
-try:
-    from fordpass_api import FordPassAPI
-except ImportError:
+# Named explicitly so --debug targets the same logger whether run as a script or imported
+logger = logging.getLogger("battery_monitor")
+
+def _load_fordpass():
+    """Import the FordPass API module, which may be saved as fordpass_api.py or fordpass-api.py"""
     try:
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("fordpass_module", "fordpass-api.py")
-        fordpass_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(fordpass_module)
-        FordPassAPI = fordpass_module.FordPassAPI
-    except ImportError:
-        try:
-            sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-            if os.path.exists("fordpass_api.py"):
-                from fordpass_api import FordPassAPI
-            elif os.path.exists("fordpass-api.py"):
-                import importlib.util
-                spec = importlib.util.spec_from_file_location("fordpass_module", "fordpass-api.py")
-                fordpass_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(fordpass_module)
-                FordPassAPI = fordpass_module.FordPassAPI
-            else:
-                print("Could not import FordPassAPI. Make sure fordpass-api.py or fordpass_api.py is in the same directory.")
-                sys.exit(1)
-        except ImportError:
-            print("Could not import FordPassAPI. Make sure fordpass-api.py or fordpass_api.py is in the same directory.")
-            sys.exit(1)
+        return importlib.import_module("fordpass_api")
+    except ModuleNotFoundError as e:
+        # Only fall back when the module itself is missing, not one of its dependencies
+        if e.name != "fordpass_api":
+            raise
+    
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fordpass-api.py")
+    if not os.path.isfile(path):
+        raise ImportError("Could not import FordPassAPI. Make sure fordpass-api.py or fordpass_api.py is in the same directory.")
+    spec = importlib.util.spec_from_file_location("fordpass_module", path)
+    fordpass_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(fordpass_module)
+    return fordpass_module
+
+FordPassAPI = _load_fordpass().FordPassAPI
 
 # Platform detection
 PLATFORM = platform.system()
-print(f"Detected platform: {PLATFORM}")
 
 # Windows-specific imports
 if PLATFORM == "Windows":
     try:
         from win10toast import ToastNotifier
         win_toaster = ToastNotifier()
+        # One long-lived worker shows toasts in order, instead of win10toast starting a thread per toast
+        win_toast_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="toast")
         win_notification_available = True
     except ImportError:
         win_notification_available = False
-        print("win10toast package not installed. For Windows notifications, install with: pip install win10toast")
+        logger.warning("win10toast package not installed. For Windows notifications, install with: pip install win10toast")
+
+# macOS-specific setup - resolve osascript once instead of searching PATH per notification
+if PLATFORM == "Darwin":
+    mac_osascript = shutil.which("osascript")
+    if not mac_osascript:
+        logger.warning("osascript not found. macOS notifications will be logged instead.")
 
 # Linux-specific imports
 if PLATFORM == "Linux":
@@ -68,17 +77,107 @@ if PLATFORM == "Linux":
             notify2.init("FordPass Battery Monitor")
             linux_notification_method = "notify2"
         except ImportError:
-            # Last resort - check if notify-send is available
-            try:
-                import subprocess
-                subprocess.run(["notify-send", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            # Last resort - check if notify-send is available (resolved once, not per notification)
+            linux_notify_send = shutil.which("notify-send")
+            if linux_notify_send:
                 linux_notification_method = "notify-send"
-            except (ImportError, FileNotFoundError):
-                print("No notification method available on Linux. Install either python3-notify2, python3-gi, or libnotify-bin package.")
+            else:
+                logger.warning("No notification method available on Linux. Install either python3-notify2, python3-gi, or libnotify-bin package.")
                 linux_notification_method = None
 
+@functools.lru_cache(maxsize=128)
+def _format_change(vin, current_range, last_range, current_charge, last_charge):
+    """
+    Build the notification for a change in battery status of the given vehicle
+    
+    Cached, since a battery hovering around a boundary keeps producing the same pairs of readings.
+    
+    Returns:
+        tuple: (title, message)
+    """
+    change_message = ""
+    if current_range != last_range:
+        change = current_range - last_range
+        direction = "increased" if change > 0 else "decreased"
+        change_message += f"Range has {direction} by {abs(change)} miles. "
+    
+    if current_charge != last_charge:
+        change = current_charge - last_charge
+        direction = "increased" if change > 0 else "decreased"
+        change_message += f"Charge has {direction} by {abs(change)}%. "
+    
+    title = f"Ford EV Battery Update ({vin})"
+    message = f"Range: {current_range} miles\nCharge: {current_charge}%\n{change_message}"
+    return title, message
+
+# Unchanged readings in a row before the polling interval starts to double
+IDLE_POLLS_BEFORE_BACKOFF = 2
+
+# State is kept in one SQLite database, one row per vehicle
+STATE_SCHEMA = """CREATE TABLE IF NOT EXISTS state (
+    vin TEXT PRIMARY KEY,
+    last_range INTEGER,
+    last_charge INTEGER,
+    updated REAL
+)"""
+
+# Notifiers - one per platform/method, picked once by select_notifier()
+def _notify_windows(title, message):
+    """Show a Windows toast notification"""
+    win_toast_pool.submit(win_toaster.show_toast, title, message, duration=10, threaded=False)
+    return True
+
+def _notify_mac(title, message):
+    """Show a macOS notification through AppleScript"""
+    # Title and message are passed as script arguments, so they never need escaping
+    subprocess.run([mac_osascript,
+                    "-e", "on run argv",
+                    "-e", "display notification (item 2 of argv) with title (item 1 of argv)",
+                    "-e", "end run",
+                    title, message],
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
+    return True
+
+def _notify_gi(title, message):
+    """Show a Linux notification through GObject Introspection"""
+    notification = Notify.Notification.new(title, message)
+    notification.set_urgency(1)  # Normal urgency
+    return notification.show()
+
+def _notify_notify2(title, message):
+    """Show a Linux notification through notify2"""
+    notification = notify2.Notification(title, message)
+    notification.set_urgency(notify2.URGENCY_NORMAL)
+    return notification.show()
+
+def _notify_send(title, message):
+    """Show a Linux notification through the notify-send command"""
+    subprocess.run([linux_notify_send, "-u", "normal", title, message], check=False)
+    return True
+
+def _notify_stdout(title, message):
+    """Fallback when no desktop notifications are available"""
+    logger.info("[NOTIFICATION] %s: %s", title, message)
+    return False
+
+def select_notifier():
+    """Pick the notifier for this platform"""
+    if PLATFORM == "Windows" and win_notification_available:
+        return _notify_windows
+    elif PLATFORM == "Darwin" and mac_osascript:
+        return _notify_mac
+    elif PLATFORM == "Linux" and linux_notification_method == "gi":
+        return _notify_gi
+    elif PLATFORM == "Linux" and linux_notification_method == "notify2":
+        return _notify_notify2
+    elif PLATFORM == "Linux" and linux_notification_method == "notify-send":
+        return _notify_send
+    else:
+        return _notify_stdout
+
 class BatteryMonitor:
-    def __init__(self, username, password, vin, interval=60, config_file="battery_monitor_config.json"):
+    def __init__(self, username, password, vin, interval=60, config_file="battery_monitor_config.db", session=None,
+                 import_legacy=True):
         """
         Initialize the battery monitor
         
@@ -87,40 +186,125 @@ class BatteryMonitor:
             password (str): FordPass password
             vin (str): Vehicle identification number
             interval (int): Polling interval in seconds (default: 60)
-            config_file (str): Path to config file for saving last known state
+            config_file (str): Path to the SQLite database for saving last known state
+            session (requests.Session): Shared HTTP session (default: create one for this monitor)
+            import_legacy (bool): Import a JSON config file left by older versions into an empty database
+                                  (default: True - pass False when several vehicles share the database)
         """
-        self.ford_api = FordPassAPI(username, password, vin)
+        self._owns_session = session is None
+        self.session = session or FordPassAPI.create_session()
+        self.ford_api = FordPassAPI(username, password, vin, session=self.session)
         self.interval = interval
-        self.config_file = config_file
+        # Older versions took a JSON file here - keep the same name with a .db extension
+        root, ext = os.path.splitext(config_file)
+        self.config_file = root + '.db' if ext == '.json' else config_file
         self.last_range = None
         self.last_charge = None
         
+        # Back off while nothing changes (parked car), snapping back to the base interval on change
+        self._miss_streak = 0
+        self._max_interval = max(interval * 10, 600)
+        
+        # Raw readings from the last poll - the sentinel makes sure the first poll is always processed
+        self._last_raw_range = self._last_raw_charge = object()
+        
+        # Notification method is fixed for the lifetime of the process
+        self._notify = select_notifier()
+        
+        # Set by run() - ends the polling loop and interrupts its sleeps
+        self._stop = None
+        
+        # Set when the in-memory state differs from what is on disk
+        self._dirty = False
+        
         # Load previous state if available
+        self._import_legacy = import_legacy
         self.load_state()
 
+    def close(self):
+        """Close the state database, and the HTTP session unless it is shared"""
+        if self._db is not None:
+            self._db.close()
+        if self._owns_session:
+            self.session.close()
+
     def load_state(self):
-        """Load the previous battery state if available"""
-        if os.path.exists(self.config_file):
+        """Open the state database and load the previous battery state if available"""
+        self._db = None
+        try:
+            # WAL journaling lets dashboards read the database while the monitor writes to it
+            db = sqlite3.connect(self.config_file, isolation_level=None)
             try:
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                    self.last_range = data.get('last_range')
-                    self.last_charge = data.get('last_charge')
-                    print(f"Loaded previous state: Range: {self.last_range} miles, Charge: {self.last_charge}%")
-            except Exception as e:
-                print(f"Error loading previous state: {e}")
+                db.execute('PRAGMA journal_mode=WAL')
+                db.execute(STATE_SCHEMA)
+            except Exception:
+                db.close()
+                raise
+            self._db = db
+        except Exception as e:
+            # Keep monitoring without saved state rather than refusing to start
+            logger.error("Error opening state database %s: %s", self.config_file, e)
+            return
+        
+        try:
+            row = self._db.execute(
+                'SELECT last_range, last_charge FROM state WHERE vin = ?',
+                (self.ford_api.vin,)
+            ).fetchone()
+            if row is None and self._import_legacy:
+                row = self.load_legacy_state()
+            if row is None:
+                return
+            
+            self.last_range, self.last_charge = row
+            logger.info("Loaded previous state for %s: Range: %s miles, Charge: %s%%",
+                        self.ford_api.vin, self.last_range, self.last_charge)
+        except Exception as e:
+            logger.error("Error loading previous state for %s: %s", self.ford_api.vin, e)
+
+    def load_legacy_state(self):
+        """Import the state from a JSON config file written by older versions, if there is one"""
+        legacy_file = os.path.splitext(self.config_file)[0] + '.json'
+        if not os.path.exists(legacy_file):
+            return None
+        # The old file has no VIN, so it can only belong to the first vehicle in an empty database
+        if self._db.execute('SELECT 1 FROM state LIMIT 1').fetchone() is not None:
+            return None
+        with open(legacy_file, 'r') as f:
+            data = json.load(f)
+        
+        self.last_range = data.get('last_range')
+        self.last_charge = data.get('last_charge')
+        self._dirty = True
+        # Retire the file once its state is in the database, so it is never imported again
+        if self.save_state():
+            os.replace(legacy_file, legacy_file + '.migrated')
+        return self.last_range, self.last_charge
 
     def save_state(self):
-        """Save the current battery state"""
+        """
+        Save the current battery state
+        
+        Returns:
+            bool: True if the state was written to the database, False otherwise
+        """
+        if self._db is None:
+            return False
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump({
-                    'last_range': self.last_range,
-                    'last_charge': self.last_charge,
-                    'last_update': time.strftime("%Y-%m-%d %H:%M:%S")
-                }, f)
+            self._db.execute(
+                """INSERT INTO state (vin, last_range, last_charge, updated)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT(vin) DO UPDATE SET
+                       last_range = excluded.last_range,
+                       last_charge = excluded.last_charge,
+                       updated = excluded.updated""",
+                (self.ford_api.vin, self.last_range, self.last_charge, time.time())
+            )
+            self._dirty = False
+            return True
         except Exception as e:
-            print(f"Error saving state: {e}")
+            logger.error("Error saving state for %s: %s", self.ford_api.vin, e)
+            return False
 
     def show_notification(self, title, message):
         """
@@ -131,151 +315,164 @@ class BatteryMonitor:
             message (str): Notification message
         """
         try:
-            # Windows notifications
-            if PLATFORM == "Windows":
-                if win_notification_available:
-                    win_toaster.show_toast(title, message, duration=10, threaded=True)
-                    return True
-                else:
-                    # Fallback for Windows
-                    print(f"[NOTIFICATION] {title}: {message}")
-                    return False
-                    
-            # macOS notifications
-            elif PLATFORM == "Darwin":
-                try:
-                    # Escape double quotes in the message
-                    message_esc = message.replace('"', '\\"')
-                    title_esc = title.replace('"', '\\"')
-                    script = f'display notification "{message_esc}" with title "{title_esc}"'
-                    os.system(f"osascript -e '{script}'")
-                    return True
-                except Exception as e:
-                    print(f"Error showing macOS notification: {e}")
-                    return False
-                    
-            # Linux notifications
-            elif PLATFORM == "Linux":
-                if linux_notification_method == "gi":
-                    notification = gi.repository.Notify.Notification.new(title, message)
-                    notification.set_urgency(1)  # Normal urgency
-                    return notification.show()
-                    
-                elif linux_notification_method == "notify2":
-                    notification = notify2.Notification(title, message)
-                    notification.set_urgency(notify2.URGENCY_NORMAL)
-                    return notification.show()
-                    
-                elif linux_notification_method == "notify-send":
-                    subprocess.run(["notify-send", title, message])
-                    return True
-                    
-                else:
-                    # Fallback for Linux
-                    print(f"[NOTIFICATION] {title}: {message}")
-                    return False
-                    
-            # Other platforms - just log
-            else:
-                print(f"[NOTIFICATION] {title}: {message}")
-                return False
-                
+            return self._notify(title, message)
         except Exception as e:
-            print(f"Error showing notification: {e}")
-            # Always print the message to terminal as fallback
-            print(f"\n{title}: {message}")
+            logger.error("Error showing notification: %s", e)
+            # Always log the message as fallback
+            logger.info("%s: %s", title, message)
             return False
 
-    def check_battery(self):
-        """Check the battery status and show notification if changed"""
+    async def _fetch(self):
+        """Fetch the raw (range, charge) reading"""
+        # FordPassAPI is blocking, so run it in the default executor to keep the event loop free
+        loop = asyncio.get_running_loop()
+        battery_info = await loop.run_in_executor(None, self.ford_api.get_battery_status)
+        return battery_info.get('ev_battery_range_miles'), battery_info.get('ev_battery_actual_charge')
+
+    def _fast_unchanged(self, raw_range, raw_charge):
+        """Check whether the raw reading is identical to the previous poll"""
+        return raw_range == self._last_raw_range and raw_charge == self._last_raw_charge
+
+    async def check_battery(self):
+        """
+        Check the battery status and show notification if changed
+        
+        Returns:
+            bool: True if the status changed, False if it is unchanged, or None if there was
+                  no reading to compare (errors, missing data, or the first reading of a new vehicle)
+        """
         try:
-            battery_info = self.ford_api.get_battery_status()
-            
-            # Get the raw values
-            raw_range = battery_info.get('ev_battery_range_miles')
-            raw_charge = battery_info.get('ev_battery_actual_charge')
+            raw_range, raw_charge = await self._fetch()
             
             if raw_range is None or raw_charge is None:
-                print("Battery information not available")
+                logger.warning("Battery information not available for %s", self.ford_api.vin)
+                return None
+            
+            # Log every reading, including unchanged ones (--debug)
+            logger.debug("Current battery status for %s - Range: %s miles, Charge: %s%%",
+                         self.ford_api.vin, raw_range, raw_charge)
+            
+            # FordPass often returns the same cached reading between vehicle wakes - nothing to do then
+            if self._fast_unchanged(raw_range, raw_charge):
                 return False
             
-            # Round values to the nearest whole number
-            current_range = round(raw_range) if raw_range is not None else None
-            current_charge = round(raw_charge) if raw_charge is not None else None
+            return self._handle_change(raw_range, raw_charge)
+        except Exception as e:
+            logger.error("Error checking battery for %s: %s", self.ford_api.vin, e)
+            return None
+
+    def _handle_change(self, raw_range, raw_charge):
+        """Process a new raw reading, notifying and saving state if the rounded values changed"""
+        first_reading = self.last_range is None or self.last_charge is None
+        self._last_raw_range = raw_range
+        self._last_raw_charge = raw_charge
+        
+        # Round values to the nearest whole number (check_battery has already ruled out missing values)
+        current_range = round(raw_range)
+        current_charge = round(raw_charge)
+        
+        # Only rewrite the state file when the stored values change
+        if current_range != self.last_range or current_charge != self.last_charge:
+            self._dirty = True
+        
+        # Check if values have changed AND if we have previous values to compare against
+        # This prevents notification on first run
+        if (self.last_range is not None and self.last_charge is not None and 
+            (current_range != self.last_range or current_charge != self.last_charge)):
             
-            # Format values for display
-            current_range_str = str(current_range) if current_range is not None else "N/A"
-            current_charge_str = str(current_charge) if current_charge is not None else "N/A"
+            # Show notification
+            title, message = _format_change(self.ford_api.vin, current_range, self.last_range, current_charge, self.last_charge)
+            self.show_notification(title, message)
             
-            # Print current values regardless of change
-            print(f"Current battery status - Range: {current_range_str} miles, Charge: {current_charge_str}%")
+            # Update stored values
+            self.last_range = current_range
+            self.last_charge = current_charge
+            self.save_state()
             
-            # Check if values have changed AND if we have previous values to compare against
-            # This prevents notification on first run
-            if (self.last_range is not None and self.last_charge is not None and 
-                (current_range != self.last_range or current_charge != self.last_charge)):
-                
-                # Create notification message
-                change_message = ""
-                if current_range != self.last_range:
-                    change = current_range - self.last_range
-                    direction = "increased" if change > 0 else "decreased"
-                    change_message += f"Range has {direction} by {abs(change)} miles. "
-                
-                if current_charge != self.last_charge:
-                    change = current_charge - self.last_charge
-                    direction = "increased" if change > 0 else "decreased"
-                    change_message += f"Charge has {direction} by {abs(change)}%. "
-                
-                # Show notification
-                title = "Ford EV Battery Update"
-                message = f"Range: {current_range_str} miles\nCharge: {current_charge_str}%\n{change_message}"
-                self.show_notification(title, message)
-                
-                # Update stored values
-                self.last_range = current_range
-                self.last_charge = current_charge
-                self.save_state()
-                
-                return True
-            else:
-                # Still update stored values even if no notification is shown
-                # This will also happen on first run
-                self.last_range = current_range
-                self.last_charge = current_charge
+            return True
+        else:
+            # Still update stored values even if no notification is shown
+            # This will also happen on first run
+            self.last_range = current_range
+            self.last_charge = current_charge
+            if self._dirty:
                 self.save_state()
-                return False
-            
-        except Exception as e:
-            print(f"Error checking battery: {e}")
+            return None if first_reading else False
+
+    async def wait(self, seconds):
+        """Wait for the given number of seconds, returning True as soon as the monitor is stopped"""
+        try:
+            await asyncio.wait_for(self._stop.wait(), seconds)
+            return True
+        except asyncio.TimeoutError:
             return False
 
-    def run(self):
-        """Run the battery monitor in a loop"""
-        print(f"Starting FordPass Battery Monitor on {PLATFORM}. Checking every {self.interval} seconds.")
+    async def run(self, stop=None):
+        """
+        Run the battery monitor in a loop
         
-        while True:
-            try:
-                # Record the check time
-                check_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                print(f"Checking battery status at {check_time}")
+        Args:
+            stop (asyncio.Event): Event that ends the loop when set (default: create one for this monitor)
+        """
+        logger.info("Starting FordPass Battery Monitor for %s on %s. Checking every %s seconds.",
+                    self.ford_api.vin, PLATFORM, self.interval)
+        self._stop = stop or asyncio.Event()
+        
+        try:
+            while not self._stop.is_set():
+                try:
+                    logger.info("Checking battery status for %s", self.ford_api.vin)
                 
-                changed = self.check_battery()
-                if changed:
-                    print("Battery status changed - notification displayed")
-                else:
-                    print("No change in battery status")
+                    changed = await self.check_battery()
+                    if changed:
+                        logger.info("Battery status changed for %s - notification displayed", self.ford_api.vin)
+                        self._miss_streak = 0
+                    elif changed is None:
+                        logger.info("No battery reading to compare for %s", self.ford_api.vin)
+                    else:
+                        logger.info("No change in battery status for %s", self.ford_api.vin)
+                        self._miss_streak += 1
                 
-                # Sleep for the configured interval
-                print(f"Sleeping for {self.interval} seconds...")
-                time.sleep(self.interval)
-            except KeyboardInterrupt:
-                print("\nMonitor stopped by user")
-                break
-            except Exception as e:
-                print(f"Unexpected error: {str(e)}")
-                print("Retrying in 30 seconds...")
-                time.sleep(30)
+                    if changed is None:
+                        # A failed check (API or auth error, missing data) says nothing about whether the car
+                        # is idle - try again at the base interval and leave the idle streak as it is
+                        sleep_for = self.interval
+                    else:
+                        # Sleep for the configured interval, doubling it (up to a cap) for each unchanged poll
+                        # once the car has been idle for IDLE_POLLS_BEFORE_BACKOFF polls in a row
+                        backoff_steps = min(max(self._miss_streak - IDLE_POLLS_BEFORE_BACKOFF, 0), 4)
+                        sleep_for = min(self.interval * 2 ** backoff_steps, self._max_interval)
+                    logger.info("%s: sleeping for %s seconds...", self.ford_api.vin, sleep_for)
+                    if await self.wait(sleep_for):
+                        break
+                except Exception as e:
+                    logger.error("Unexpected error for %s: %s", self.ford_api.vin, e)
+                    logger.info("%s: retrying in 30 seconds...", self.ford_api.vin)
+                    if await self.wait(30):
+                        break
+        finally:
+            # Flush any state that failed to save earlier
+            if self._dirty:
+                self.save_state()
+            self.close()
+
+async def run_monitors(monitors):
+    """Run several monitors concurrently on a single event loop until SIGINT/SIGTERM"""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    
+    def request_stop(*_):
+        logger.info("Stopping monitor...")
+        stop.set()
+    
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, request_stop)
+        except NotImplementedError:
+            # Windows event loops don't support add_signal_handler
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(request_stop))
+    
+    await asyncio.gather(*(monitor.run(stop) for monitor in monitors))
 
 def run_monitor(args):
     """Run the monitor with the given arguments"""
@@ -302,26 +499,40 @@ def run_monitor(args):
         except ImportError:
             password = input("Enter your FordPass password: ")
     if not vin:
-        vin = input("Enter your vehicle VIN: ")
+        vin = input("Enter your vehicle VIN(s): ")
+    
+    # Several vehicles can be monitored at once with a comma-separated VIN list
+    vins = [v.strip() for v in vin.split(",") if v.strip()]
     
     # Log the startup
-    print(f"Starting FordPass Battery Monitor for VIN: {vin}")
-    print(f"Checking every {args.interval} seconds")
+    logger.info("Starting FordPass Battery Monitor for VIN: %s", ", ".join(vins))
+    logger.info("Checking every %s seconds", args.interval)
+    
+    # Create the monitors - all vehicles share one connection pool and state database and are polled concurrently
+    session = FordPassAPI.create_session()
+    # The legacy JSON state has no VIN, so it is only imported when a single vehicle is monitored
+    monitors = [BatteryMonitor(username, password, v, args.interval, args.config, session=session,
+                               import_legacy=len(vins) == 1)
+                for v in vins]
     
-    # Create and run the monitor
-    monitor = BatteryMonitor(username, password, vin, args.interval, args.config)
-    monitor.run()
+    try:
+        asyncio.run(run_monitors(monitors))
+        logger.info("Monitor stopped")
+    finally:
+        session.close()
 
 def main():
     """Main function to parse arguments and start the monitor"""
     parser = argparse.ArgumentParser(description='Monitor Ford EV battery status and show notifications on changes')
     parser.add_argument('--username', '-u', help='FordPass username/email')
     parser.add_argument('--password', '-p', help='FordPass password')
-    parser.add_argument('--vin', '-v', help='Vehicle identification number')
+    parser.add_argument('--vin', '-v', help='Vehicle identification number (comma-separated for several vehicles)')
     parser.add_argument('--interval', '-i', type=int, default=60, 
                         help='Check interval in seconds (default: 60)')
-    parser.add_argument('--config', '-c', default='battery_monitor_config.json',
-                        help='Config file path for saving state')
+    parser.add_argument('--config', '-c', default='battery_monitor_config.db',
+                        help='SQLite database path for saving state')
+    parser.add_argument('--debug', action='store_true',
+                        help='Log the battery status read on every check')
     
     # Add daemon mode option only for Linux and macOS
     if PLATFORM != "Windows":
@@ -330,6 +541,12 @@ def main():
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    if args.debug:
+        # Only this module's logger - requests/urllib3 debug output stays quiet
+        logger.setLevel(logging.DEBUG)
+    logger.info("Detected platform: %s", PLATFORM)
+    
     # Run as daemon if requested (Linux/macOS only)
     if PLATFORM != "Windows" and hasattr(args, 'daemon') and args.daemon:
         try:
@@ -337,7 +554,7 @@ def main():
             with daemon.DaemonContext():
                 run_monitor(args)
         except ImportError:
-            print("python-daemon package not installed. Running in foreground instead.")
+            logger.warning("python-daemon package not installed. Running in foreground instead.")
             run_monitor(args)
     else:
         # For Windows, we'll just run normally
@@ -1,204 +1,402 @@
 import requests
+import argparse
+import asyncio
+import hashlib
 import json
+import logging
+import os
+import pathlib
+import re
+import sys
+import tempfile
+import threading
 import time
-import urllib.parse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-class FordPassAPI:
+logger = logging.getLogger(__name__)
+
+# appdirs is optional - it only decides where the token cache lives
+try:
+    import appdirs
+except ImportError:
+    appdirs = None
+
+# orjson is optional - it parses the telemetry responses several times faster than json
+try:
+    import orjson
+    _parse = orjson.loads
+except ImportError:
+    orjson = None
+    _parse = json.loads
+
+# httpx is optional - it is only needed for AsyncFordPassAPI
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+def _user_cache_dir():
+    """Get the per-user cache directory for FordPass data"""
+    if appdirs:
+        return appdirs.user_cache_dir("fordpass")
+    return os.path.join(os.path.expanduser("~"), ".cache", "fordpass")
+
+# Conversion factor for the kilometre values reported by the telemetry API
+MILES_PER_KM = 0.6213711922
+
+# Every request is bounded, so a shutdown never waits on a hung connection: seconds to connect, seconds to read
+REQUEST_TIMEOUT = (5, 15)
+# Retry policy shared by the requests session and the httpx client: attempts after the first,
+# exponential backoff factor in seconds, and the statuses worth retrying
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Longest Retry-After wait that is honoured, in seconds
+RETRY_AFTER_MAX = 10
+
+class _BoundedRetry(Retry):
+    """Retry that honours Retry-After, but never waits longer than RETRY_AFTER_MAX"""
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_AFTER_MAX)
+
+def _retry(*methods):
+    """Retry policy for connection errors, 429 and 5xx responses, honouring a bounded Retry-After"""
+    # The last failed response is returned rather than raised, so callers still see its status code
+    return _BoundedRetry(total=RETRY_TOTAL, connect=RETRY_TOTAL, read=RETRY_TOTAL, status=RETRY_TOTAL,
+                         backoff_factor=RETRY_BACKOFF, status_forcelist=RETRY_STATUSES,
+                         allowed_methods=frozenset(methods), respect_retry_after_header=True,
+                         raise_on_status=False)
+
+def _retry_after(response):
+    """Get the Retry-After wait of an httpx response in seconds, capped at RETRY_AFTER_MAX, or None"""
+    try:
+        return min(float(response.headers["Retry-After"]), RETRY_AFTER_MAX)
+    except (KeyError, ValueError):
+        # Missing, or an HTTP date - fall back to the normal backoff
+        return None
+
+class FordPassHTTPError(Exception):
+    """An API call returned an error status"""
+    def __init__(self, message, status_code, text=""):
+        super().__init__(message, status_code, text)
+        self.message = message
+        self.status_code = status_code
+        self.text = text
+    
+    @classmethod
+    def from_response(cls, message, response):
+        """Build the error from a response, keeping only the start of a possibly large error body"""
+        return cls(message, response.status_code, response.content[:512].decode("utf-8", "replace"))
+    
+    def __str__(self):
+        return f"{self.message}: {self.status_code} - {self.text}"
+
+class TokenStore:
+    """Keeps the Autonomic access token on disk so a new process can skip authentication"""
+    # One lock per token file, shared by every TokenStore in the process that uses it
+    _locks = {}
+    _locks_guard = threading.Lock()
+    
+    def __init__(self, username, cache_dir=None):
+        # One file per account - the token belongs to the account, so only the username is hashed
+        # (keeping the email out of the file name); the password never goes into it
+        key = hashlib.sha256(username.encode()).hexdigest()
+        self.path = pathlib.Path(cache_dir or _user_cache_dir()) / f"{key}.json"
+        # Held while authenticating or writing, so clients for several vehicles of one account
+        # authenticate once between them and never write the file at the same time
+        with TokenStore._locks_guard:
+            self.lock = TokenStore._locks.setdefault(self.path, threading.RLock())
+    
+    def load(self):
+        """Get the stored (token, expiration), or (None, 0) if there is none"""
+        try:
+            data = json.loads(self.path.read_text())
+            return data["access_token"], data["expiration"]
+        except (OSError, ValueError, KeyError):
+            return None, 0
+    
+    def save(self, token, expiration):
+        """Store the token - failures are ignored since the cache is only an optimization"""
+        with self.lock:
+            try:
+                # The directory and the file are both private to the current user (mkstemp uses mode 0600).
+                # Each write gets its own temporary file, so concurrent saves can't interleave.
+                self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"access_token": token, "expiration": expiration}, f)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass
+    
+    def clear(self):
+        """Remove the stored token"""
+        with self.lock:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+    
+    def discard(self, token):
+        """Remove the stored token if it is the given one, keeping a newer token saved by another client"""
+        with self.lock:
+            if self.load()[0] == token:
+                self.clear()
+
+class VehicleSnapshot:
+    """Flat view of the telemetry metrics, extracted in a single pass over the response"""
+    # Metrics whose "value" is kept, by attribute name
+    VALUE_FIELDS = {
+        "batteryStateOfCharge": "battery_soc",
+        "xevBatteryStateOfCharge": "xev_soc",
+        "xevBatteryActualStateOfCharge": "xev_actual_soc",
+        "xevBatteryRange": "xev_range_km",
+        "xevBatteryCapacity": "xev_capacity_kwh",
+        "xevBatteryEnergyRemaining": "xev_energy_remaining_kwh",
+        "xevBatteryTemperature": "xev_temperature",
+        "xevBatteryVoltage": "xev_voltage",
+        "xevBatteryPerformanceStatus": "xev_performance",
+        "xevBatteryTimeToFullCharge": "xev_time_to_full_charge",
+        "hoodStatus": "hood",
+        "alarmStatus": "alarm",
+        "odometer": "odometer_km",
+        "heading": "heading",
+        "compassDirection": "compass_direction",
+        "outsideTemperature": "outside_temp_c",
+        "ambientTemp": "ambient_temp",
+        "engineCoolantTemp": "engine_coolant_temp",
+        "speed": "speed",
+        "ignitionStatus": "ignition_status",
+        "oilLifeRemaining": "oil_life_remaining",
+        "parkingBrakeStatus": "parking_brake_status",
+        "gearLeverPosition": "gear_position",
+        "hybridVehicleModeStatus": "hybrid_vehicle_mode",
+        "displaySystemOfMeasure": "display_units",
+        "xevPlugChargerStatus": "plug_status",
+        "xevBatteryChargeDisplayStatus": "charger_status",
+        "xevBatteryChargerCurrentOutput": "charger_current_output",
+        "xevBatteryChargerVoltageOutput": "charger_voltage_output",
+        "xevEvseBatteryDcVoltageOutput": "dc_voltage_output",
+        "xevEvseBatteryDcCurrentOutput": "dc_current_output",
+        "xevChargeStationPowerType": "charger_type",
+        "xevChargeStationCommunicationStatus": "communication_status",
+        "tripFuelEconomy": "trip_fuel_economy",
+        "tripXevBatteryRangeRegenerated": "trip_battery_range_regenerated",
+        "tripXevBatteryChargeRegenerated": "trip_battery_charge_regenerated",
+        "tripXevBatteryDistanceAccumulated": "trip_battery_distance"
+    }
+    # Metrics kept whole - arrays, or entries where more than the value is needed
+    RAW_FIELDS = {
+        "doorStatus": "doors",
+        "doorLockStatus": "door_locks",
+        "tirePressure": "tire_pressures",
+        "tirePressureStatus": "tire_statuses",
+        "tirePressureSystemStatus": "tire_system_status",
+        "windowStatus": "windows",
+        "indicators": "indicators",
+        "customMetrics": "custom_metrics",
+        "position": "position"
+    }
+    __slots__ = tuple(VALUE_FIELDS.values()) + tuple(RAW_FIELDS.values())
+    
+    def __init__(self, metrics):
+        for name in self.__slots__:
+            setattr(self, name, None)
+        
+        value_fields = self.VALUE_FIELDS
+        raw_fields = self.RAW_FIELDS
+        for key, metric in metrics.items():
+            name = value_fields.get(key)
+            if name:
+                if isinstance(metric, dict):
+                    setattr(self, name, metric.get("value"))
+            else:
+                name = raw_fields.get(key)
+                if name:
+                    setattr(self, name, metric)
+
+class _FordPassBase:
+    """Account details, response handling and report sections shared by FordPassAPI and AsyncFordPassAPI"""
+    # No per-instance __dict__ - every attribute is declared here or in the client classes
+    __slots__ = (
+        "username", "password", "vin",
+        "autonomic_token", "autonomic_token_expiration", "token_store",
+        "status_ttl", "_status_cache", "_status_cache_expiry", "_snapshot_cache",
+        "ford_token_url", "autonomic_token_url", "command_endpoint", "status_endpoint", "status_file",
+        "client_id", "application_id"
+    )
+    
+    # Substrings identifying the trip custom metrics, and the field each one fills
+    _TRIP_PATTERNS = [
+        ("trip-sum-length", "trip_length"),
+        ("accumulated-acceleration-coaching-score", "acceleration_score"),
+        ("accumulated-deceleration-coaching-score", "deceleration_score"),
+        ("accumulated-vehicle-speed-cruising-coaching-score", "cruising_score")
+    ]
+    _TRIP_RE = re.compile("|".join(f"(?P<{name}>{re.escape(sub)})" for sub, name in _TRIP_PATTERNS))
+    
     def __init__(self, username, password, vin):
         self.username = username
         self.password = password
         self.vin = vin
         
-        # Token storage
-        self.ford_token = None
+        # Token storage - only the Autonomic token is kept; the Ford token is used once to obtain it
         self.autonomic_token = None
-        self.token_expiration = 0
+        self.autonomic_token_expiration = 0
+        self.token_store = TokenStore(username)
+        
+        # Short-lived cache of the telemetry response - a summary reads it once per section
+        self.status_ttl = 15  # seconds
+        self._status_cache = None
+        self._status_cache_expiry = 0
+        self._snapshot_cache = None
         
         # Authentication URLs from screenshots
         self.ford_token_url = "https://us-central1-ford-connected-car.cloudfunctions.net/api/auth"
         self.autonomic_token_url = "https://accounts.autonomic.ai/v1/auth/oidc/token"
         
-        # API endpoints from screenshots
-        self.command_url = "https://api.autonomic.ai/v1/command/vehicles/{vin}/commands"
-        self.status_url = "https://api.autonomic.ai/v1/telemetry/sources/fordpass/vehicles/{vin}"
+        # API endpoints from screenshots - the VIN is fixed for the instance, so build them once
+        self.command_endpoint = f"https://api.autonomic.ai/v1/command/vehicles/{vin}/commands"
+        self.status_endpoint = f"https://api.autonomic.ai/v1/telemetry/sources/fordpass/vehicles/{vin}"
+        
+        # Last telemetry response, one file per vehicle so several instances don't overwrite each other
+        self.status_file = f"fordpass_status_{vin}.json"
         
         # Client ID and Application ID from the screenshots
         self.client_id = "9fb503e0-715b-47e8-adfd-4b7770f73b"
         self.application_id = "71A3AD0A-CF46-4CCF-B473-FC7FE5BC4592"
-        
-        # Headers based on screenshots
-        self.headers = {
+    
+    def _base_headers(self):
+        """Headers sent with every request, based on screenshots"""
+        return {
             "Accept": "*/*",
             "User-Agent": "FordPass/2 CFNetwork/1475 Darwin/23.0.0",
             "Accept-Language": "en-US,en;q=0.9",
             "Application-Id": self.application_id
         }
     
-    def get_ford_token(self):
-        """Get the initial FordPass authentication token"""
-        if self.ford_token and time.time() < self.token_expiration:
-            return self.ford_token
-        
-        # Just prepare the authentication data
-        auth_data = {
+    def invalidate_status(self):
+        """Drop the cached vehicle status so the next call fetches it again"""
+        self._status_cache = None
+        self._status_cache_expiry = 0
+        self._snapshot_cache = None
+    
+    # Request building and response handling
+    
+    def _ford_auth_data(self):
+        """Build the FordPass login payload"""
+        return {
             "username": self.username,
             "password": self.password
         }
-        
-        headers = self.headers.copy()
-        headers["Content-Type"] = "application/json"
-        
-        try:
-            response = requests.post(
-                self.ford_token_url,
-                headers=headers,
-                json=auth_data
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                # Check if status is 200 in the response JSON
-                if data.get("status") == 200:
-                    self.ford_token = data.get("access_token")
-                    # Set a short expiration time since we'll be getting the Autonomic token next
-                    self.token_expiration = time.time() + 300  # 5 minutes
-                    return self.ford_token
-                else:
-                    # Extract the message if available
-                    message = data.get("message", "Unknown error")
-                    raise Exception(f"Ford authentication failed: {message}")
-            else:
-                raise Exception(f"Ford authentication failed: {response.status_code} - {response.text}")
-        except Exception as e:
-            raise Exception(f"Ford token request failed: {str(e)}")
     
-    def get_autonomic_token(self):
-        """Get the Autonomic token using the Ford token"""
-        if self.autonomic_token and time.time() < self.token_expiration:
-            return self.autonomic_token
-        
-        # First get Ford token if we don't have it
-        ford_token = self.get_ford_token()
-        
-        # Now get Autonomic token using the token exchange grant type with CORRECT parameters
-        auth_data = {
+    def _autonomic_auth_data(self, ford_token):
+        """Build the token exchange form data for the Autonomic token"""
+        # Token exchange grant type with CORRECT parameters
+        return {
             "subject_token": ford_token,
             "subject_issuer": "fordpass",
             "client_id": "fordpass-prod",  # This is the correct client_id
             "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
             "subject_token_type": "urn:ietf:params:oauth:token-type:jwt"
         }
-        
-        headers = self.headers.copy()
-        headers["Content-Type"] = "application/x-www-form-urlencoded"
-        
-        # Convert form data to URL-encoded format
-        encoded_data = urllib.parse.urlencode(auth_data)
-        
-        try:
-            response = requests.post(
-                self.autonomic_token_url,
-                headers=headers,
-                data=encoded_data
-            )
-            
-            if response.status_code == 200:
-                token_data = response.json()
-                self.autonomic_token = token_data.get("access_token")
-                self.token_expiration = time.time() + token_data.get("expires_in", 3600) - 60
-                return self.autonomic_token
-            else:
-                raise Exception(f"Autonomic authentication failed: {response.status_code} - {response.text}")
-        except Exception as e:
-            raise Exception(f"Autonomic token request failed: {str(e)}")
-        
-    def get_auth_token(self):
-        """Get the final authentication token to use for API calls"""
-        return self.get_autonomic_token()
     
-    def execute_command(self, command):
-        """Execute a command on the vehicle (lock, unlock, start, stop, etc.)"""
-        token = self.get_auth_token()
-        
-        # If command is 'status', use the status endpoint
-        if command == "status":
-            return self.get_vehicle_status()
-        
-        # For other commands, use the command endpoint
-        command_endpoint = self.command_url.format(vin=self.vin)
-        
-        headers = self.headers.copy()
-        headers["Authorization"] = f"Bearer {token}"
-        headers["Content-Type"] = "application/json"
-        
-        # JSON payload for the command
-        command_data = {
-            "command": command
-        }
-        
-        try:
-            response = requests.post(
-                command_endpoint,
-                headers=headers,
-                json=command_data
-            )
-            
-            if response.status_code in (200, 202):
-                return response.json()
+    def _read_ford_token(self, response):
+        """Get the Ford token from a login response"""
+        if response.status_code == 200:
+            data = _parse(response.content)
+            # Check if status is 200 in the response JSON
+            if data.get("status") == 200:
+                return data.get("access_token")
             else:
-                raise Exception(f"Command failed: {response.status_code} - {response.text}")
-        except Exception as e:
-            raise Exception(f"Command execution failed: {str(e)}")
+                # Extract the message if available
+                message = data.get("message", "Unknown error")
+                raise Exception(f"Ford authentication failed: {message}")
+        else:
+            raise FordPassHTTPError.from_response("Ford authentication failed", response)
     
-    def get_vehicle_status(self):
-        """Get vehicle status information and save to file"""
-        token = self.get_auth_token()
-        
-        # Format the status URL with the VIN
-        status_endpoint = self.status_url.format(vin=self.vin)
-        
-        headers = self.headers.copy()
-        headers["Authorization"] = f"Bearer {token}"
-        
-        try:
-            response = requests.get(
-                status_endpoint,
-                headers=headers
-            )
+    def _cached_autonomic_token(self):
+        """Get the in-memory Autonomic token if it is still valid, or None"""
+        if self.autonomic_token and time.time() < self.autonomic_token_expiration:
+            return self.autonomic_token
+        return None
+    
+    def _load_stored_token(self):
+        """Adopt a still-valid token saved by an earlier run, or return None - this reads the token store"""
+        token, expiration = self.token_store.load()
+        if token and time.time() < expiration:
+            self.autonomic_token = token
+            self.autonomic_token_expiration = expiration
+            return self.autonomic_token
+        return None
+    
+    def _store_autonomic_token(self, response):
+        """Keep the Autonomic token from a token exchange response - the caller saves it to the token store"""
+        if response.status_code == 200:
+            token_data = _parse(response.content)
+            if "expires_in" not in token_data:
+                raise Exception("Autonomic authentication failed: response has no expires_in")
+            self.autonomic_token = token_data.get("access_token")
+            self.autonomic_token_expiration = time.time() + token_data["expires_in"] - 60
+            return self.autonomic_token
+        else:
+            raise FordPassHTTPError.from_response("Autonomic authentication failed", response)
+    
+    def _forget_tokens(self):
+        """Forget the in-memory tokens - the caller also clears the token store"""
+        self.autonomic_token = None
+        self.autonomic_token_expiration = 0
+    
+    def _command_result(self, response):
+        """Get the result of a vehicle command"""
+        if response.status_code in (200, 202):
+            # The command changes the vehicle, so the cached status is now stale
+            self.invalidate_status()
+            return _parse(response.content)
+        else:
+            raise FordPassHTTPError.from_response("Command failed", response)
+    
+    def _store_status(self, response):
+        """Parse a telemetry response and cache it"""
+        if response.status_code == 200:
+            status_data = _parse(response.content)
             
-            if response.status_code == 200:
-                status_data = response.json()
-                
-                # Save to file
-                with open("fordpass_status.json", "w") as f:
-                    json.dump(status_data, indent=2, fp=f)
-                    
-                print(f"Status response saved to fordpass_status.json")
-                return status_data
-            else:
-                raise Exception(f"Status request failed: {response.status_code} - {response.text}")
-        except Exception as e:
-            raise Exception(f"Vehicle status request failed: {str(e)}")
-        
+            self._status_cache = status_data
+            self._status_cache_expiry = time.time() + self.status_ttl
+            self._snapshot_cache = VehicleSnapshot(status_data.get("metrics", {}))
+            return status_data
+        else:
+            raise FordPassHTTPError.from_response("Status request failed", response)
+    
+    def _save_status_file(self, body):
+        """Save a telemetry body to file exactly as received, rather than re-serializing the parsed data"""
+        with open(self.status_file, "wb") as f:
+            f.write(body)
+        logger.debug("Status response saved to %s", self.status_file)
+    
+    def _snapshot(self):
+        """Get the flattened metrics of the vehicle status"""
+        raise NotImplementedError
     
     def get_battery_status(self):
         """Get comprehensive battery status information"""
         try:
-            status = self.get_vehicle_status()
-            metrics = status.get("metrics", {})
+            snapshot = self._snapshot()
             
             battery_info = {
-                "main_battery_charge": metrics.get("batteryStateOfCharge", {}).get("value"),
-                "ev_battery_charge": metrics.get("xevBatteryStateOfCharge", {}).get("value"),
-                "ev_battery_actual_charge": metrics.get("xevBatteryActualStateOfCharge", {}).get("value"),
-                "ev_battery_range_km": metrics.get("xevBatteryRange", {}).get("value"),
-                "ev_battery_range_miles": round((metrics.get("xevBatteryRange", {}).get("value") or 0) * 0.621371),
-                "ev_battery_capacity_kwh": metrics.get("xevBatteryCapacity", {}).get("value"),
-                "ev_battery_energy_remaining_kwh": metrics.get("xevBatteryEnergyRemaining", {}).get("value"),
-                "ev_battery_temperature": metrics.get("xevBatteryTemperature", {}).get("value"),
-                "ev_battery_voltage": metrics.get("xevBatteryVoltage", {}).get("value"),
-                "ev_battery_performance": metrics.get("xevBatteryPerformanceStatus", {}).get("value"),
-                "ev_time_to_full_charge": metrics.get("xevBatteryTimeToFullCharge", {}).get("value")
+                "main_battery_charge": snapshot.battery_soc,
+                "ev_battery_charge": snapshot.xev_soc,
+                "ev_battery_actual_charge": snapshot.xev_actual_soc,
+                "ev_battery_range_km": snapshot.xev_range_km,
+                "ev_battery_range_miles": round((snapshot.xev_range_km or 0) * MILES_PER_KM),
+                "ev_battery_capacity_kwh": snapshot.xev_capacity_kwh,
+                "ev_battery_energy_remaining_kwh": snapshot.xev_energy_remaining_kwh,
+                "ev_battery_temperature": snapshot.xev_temperature,
+                "ev_battery_voltage": snapshot.xev_voltage,
+                "ev_battery_performance": snapshot.xev_performance,
+                "ev_time_to_full_charge": snapshot.xev_time_to_full_charge
             }
             
             return battery_info
@@ -208,31 +406,27 @@ class FordPassAPI:
     def get_door_status(self):
         """Get door status information"""
         try:
-            status = self.get_vehicle_status()
-            metrics = status.get("metrics", {})
+            snapshot = self._snapshot()
             
             # Process door status array
             doors = {}
-            for door in metrics.get("doorStatus", []):
+            for door in snapshot.doors or []:
                 door_id = door.get("vehicleDoor")
                 door_value = door.get("value")
                 doors[door_id] = door_value
             
             # Process door lock status
             locks = {}
-            for lock in metrics.get("doorLockStatus", []):
+            for lock in snapshot.door_locks or []:
                 lock_id = lock.get("vehicleDoor")
                 lock_value = lock.get("value")
                 locks[lock_id] = lock_value
             
-            # Hood status
-            hood = metrics.get("hoodStatus", {}).get("value")
-            
             return {
                 "doors": doors,
                 "locks": locks,
-                "hood": hood,
-                "alarm": metrics.get("alarmStatus", {}).get("value")
+                "hood": snapshot.hood,
+                "alarm": snapshot.alarm
             }
         except Exception as e:
             return f"Unable to retrieve door information: {str(e)}"
@@ -240,13 +434,10 @@ class FordPassAPI:
     def get_mileage(self):
         """Get the vehicle's current mileage"""
         try:
-            status = self.get_vehicle_status()
-            metrics = status.get("metrics", {})
-            
-            odometer_value = metrics.get("odometer", {}).get("value")
+            odometer_value = self._snapshot().odometer_km
                 
             if odometer_value is not None:
-                miles = round(odometer_value * 0.621371)
+                miles = round(odometer_value * MILES_PER_KM)
                 return f"Vehicle has {miles} miles on it."
             else:
                 return "Odometer information not available"
@@ -256,12 +447,11 @@ class FordPassAPI:
     def get_tire_status(self):
         """Get tire pressure and status information"""
         try:
-            status = self.get_vehicle_status()
-            metrics = status.get("metrics", {})
+            snapshot = self._snapshot()
             
             # Process tire pressure array
             pressures = {}
-            for tire in metrics.get("tirePressure", []):
+            for tire in snapshot.tire_pressures or []:
                 tire_id = tire.get("vehicleWheel")
                 tire_value = tire.get("value")
                 tire_placard = tire.get("wheelPlacardFront") or tire.get("wheelPlacardRear")
@@ -272,7 +462,7 @@ class FordPassAPI:
             
             # Process tire status array
             statuses = {}
-            for tire in metrics.get("tirePressureStatus", []):
+            for tire in snapshot.tire_statuses or []:
                 tire_id = tire.get("vehicleWheel")
                 tire_value = tire.get("value")
                 if tire_id:
@@ -283,7 +473,7 @@ class FordPassAPI:
             return {
                 "pressures": pressures,
                 "statuses": statuses,
-                "system_status": metrics.get("tirePressureSystemStatus", [{}])[0].get("value")
+                "system_status": (snapshot.tire_system_status or [{}])[0].get("value")
             }
         except Exception as e:
             return f"Unable to retrieve tire information: {str(e)}"
@@ -291,20 +481,19 @@ class FordPassAPI:
     def get_location(self):
         """Get vehicle location information"""
         try:
-            status = self.get_vehicle_status()
-            metrics = status.get("metrics", {})
+            snapshot = self._snapshot()
             
-            position = metrics.get("position", {}).get("value", {}).get("location", {})
-            heading_data = metrics.get("heading", {}).get("value", {})
-            compass = metrics.get("compassDirection", {}).get("value")
+            position_metric = snapshot.position or {}
+            position = (position_metric.get("value") or {}).get("location", {})
+            heading_data = snapshot.heading or {}
             
             return {
                 "latitude": position.get("lat"),
                 "longitude": position.get("lon"),
                 "altitude": position.get("alt"),
                 "heading_degrees": heading_data.get("heading"),
-                "compass_direction": compass,
-                "update_time": metrics.get("position", {}).get("updateTime")
+                "compass_direction": snapshot.compass_direction,
+                "update_time": position_metric.get("updateTime")
             }
         except Exception as e:
             return f"Unable to retrieve location information: {str(e)}"
@@ -312,11 +501,8 @@ class FordPassAPI:
     def get_window_status(self):
         """Get window position information"""
         try:
-            status = self.get_vehicle_status()
-            metrics = status.get("metrics", {})
-            
             windows = {}
-            for window in metrics.get("windowStatus", []):
+            for window in self._snapshot().windows or []:
                 window_id = f"{window.get('vehicleWindow')}_{window.get('vehicleSide')}"
                 range_data = window.get("value", {}).get("doubleRange", {})
                 windows[window_id] = {
@@ -331,17 +517,16 @@ class FordPassAPI:
     def get_climate_status(self):
         """Get climate and temperature information"""
         try:
-            status = self.get_vehicle_status()
-            metrics = status.get("metrics", {})
+            snapshot = self._snapshot()
             
-            outside_temp_c = metrics.get("outsideTemperature", {}).get("value")
+            outside_temp_c = snapshot.outside_temp_c
             outside_temp_f = outside_temp_c * 9/5 + 32 if outside_temp_c is not None else None
             
             return {
                 "outside_temperature_c": outside_temp_c,
                 "outside_temperature_f": outside_temp_f,
-                "ambient_temp": metrics.get("ambientTemp", {}).get("value"),
-                "engine_coolant_temp": metrics.get("engineCoolantTemp", {}).get("value")
+                "ambient_temp": snapshot.ambient_temp,
+                "engine_coolant_temp": snapshot.engine_coolant_temp
             }
         except Exception as e:
             return f"Unable to retrieve climate information: {str(e)}"
@@ -349,22 +534,21 @@ class FordPassAPI:
     def get_vehicle_info(self):
         """Get general vehicle information"""
         try:
-            status = self.get_vehicle_status()
-            metrics = status.get("metrics", {})
+            snapshot = self._snapshot()
             
-            odometer_km = metrics.get("odometer", {}).get("value")
-            odometer_miles = round(odometer_km * 0.621371) if odometer_km is not None else None
+            odometer_km = snapshot.odometer_km
+            odometer_miles = round(odometer_km * MILES_PER_KM) if odometer_km is not None else None
             
             return {
                 "odometer_km": odometer_km,
                 "odometer_miles": odometer_miles,
-                "speed": metrics.get("speed", {}).get("value"),
-                "ignition_status": metrics.get("ignitionStatus", {}).get("value"),
-                "oil_life_remaining": metrics.get("oilLifeRemaining", {}).get("value"),
-                "parking_brake_status": metrics.get("parkingBrakeStatus", {}).get("value"),
-                "gear_position": metrics.get("gearLeverPosition", {}).get("value"),
-                "hybrid_vehicle_mode": metrics.get("hybridVehicleModeStatus", {}).get("value"),
-                "display_units": metrics.get("displaySystemOfMeasure", {}).get("value")
+                "speed": snapshot.speed,
+                "ignition_status": snapshot.ignition_status,
+                "oil_life_remaining": snapshot.oil_life_remaining,
+                "parking_brake_status": snapshot.parking_brake_status,
+                "gear_position": snapshot.gear_position,
+                "hybrid_vehicle_mode": snapshot.hybrid_vehicle_mode,
+                "display_units": snapshot.display_units
             }
         except Exception as e:
             return f"Unable to retrieve vehicle information: {str(e)}"
@@ -372,10 +556,7 @@ class FordPassAPI:
     def get_warning_indicators(self):
         """Get warning indicator status"""
         try:
-            status = self.get_vehicle_status()
-            metrics = status.get("metrics", {})
-            
-            indicators = metrics.get("indicators", {})
+            indicators = self._snapshot().indicators or {}
             # Filter for active indicators only
             active_indicators = {}
             
@@ -390,18 +571,17 @@ class FordPassAPI:
     def get_ev_charging_status(self):
         """Get EV charging status information"""
         try:
-            status = self.get_vehicle_status()
-            metrics = status.get("metrics", {})
+            snapshot = self._snapshot()
             
             return {
-                "plug_status": metrics.get("xevPlugChargerStatus", {}).get("value"),
-                "charger_status": metrics.get("xevBatteryChargeDisplayStatus", {}).get("value"),
-                "charger_current_output": metrics.get("xevBatteryChargerCurrentOutput", {}).get("value"),
-                "charger_voltage_output": metrics.get("xevBatteryChargerVoltageOutput", {}).get("value"),
-                "dc_voltage_output": metrics.get("xevEvseBatteryDcVoltageOutput", {}).get("value"),
-                "dc_current_output": metrics.get("xevEvseBatteryDcCurrentOutput", {}).get("value"),
-                "charger_type": metrics.get("xevChargeStationPowerType", {}).get("value"),
-                "communication_status": metrics.get("xevChargeStationCommunicationStatus", {}).get("value")
+                "plug_status": snapshot.plug_status,
+                "charger_status": snapshot.charger_status,
+                "charger_current_output": snapshot.charger_current_output,
+                "charger_voltage_output": snapshot.charger_voltage_output,
+                "dc_voltage_output": snapshot.dc_voltage_output,
+                "dc_current_output": snapshot.dc_current_output,
+                "charger_type": snapshot.charger_type,
+                "communication_status": snapshot.communication_status
             }
         except Exception as e:
             return f"Unable to retrieve EV charging information: {str(e)}"
@@ -409,35 +589,25 @@ class FordPassAPI:
     def get_trip_info(self):
         """Get trip-related information"""
         try:
-            status = self.get_vehicle_status()
-            metrics = status.get("metrics", {})
-            custom_metrics = metrics.get("customMetrics", {})
-            
-            # Fix the access to custom metrics
-            trip_length = None
-            acceleration_score = None
-            deceleration_score = None
-            cruising_score = None
+            snapshot = self._snapshot()
+            custom_metrics = snapshot.custom_metrics or {}
             
+            # Custom metric keys embed the metric name, so one regex search picks the field
+            scores = {}
             for key, value in custom_metrics.items():
-                if "trip-sum-length" in key:
-                    trip_length = value.get("value")
-                elif "accumulated-acceleration-coaching-score" in key:
-                    acceleration_score = value.get("value")
-                elif "accumulated-deceleration-coaching-score" in key:
-                    deceleration_score = value.get("value")
-                elif "accumulated-vehicle-speed-cruising-coaching-score" in key:
-                    cruising_score = value.get("value")
+                match = self._TRIP_RE.search(key)
+                if match:
+                    scores[match.lastgroup] = value.get("value")
             
             return {
-                "trip_length": trip_length,
-                "trip_fuel_economy": metrics.get("tripFuelEconomy", {}).get("value"),
-                "trip_battery_range_regenerated": metrics.get("tripXevBatteryRangeRegenerated", {}).get("value"),
-                "trip_battery_charge_regenerated": metrics.get("tripXevBatteryChargeRegenerated", {}).get("value"),
-                "trip_battery_distance": metrics.get("tripXevBatteryDistanceAccumulated", {}).get("value"),
-                "acceleration_score": acceleration_score,
-                "deceleration_score": deceleration_score,
-                "cruising_score": cruising_score
+                "trip_length": scores.get("trip_length"),
+                "trip_fuel_economy": snapshot.trip_fuel_economy,
+                "trip_battery_range_regenerated": snapshot.trip_battery_range_regenerated,
+                "trip_battery_charge_regenerated": snapshot.trip_battery_charge_regenerated,
+                "trip_battery_distance": snapshot.trip_battery_distance,
+                "acceleration_score": scores.get("acceleration_score"),
+                "deceleration_score": scores.get("deceleration_score"),
+                "cruising_score": scores.get("cruising_score")
             }
         except Exception as e:
             return f"Unable to retrieve trip information: {str(e)}"
@@ -453,6 +623,16 @@ class FordPassAPI:
             location_info = self.get_location()
             tire_info = self.get_tire_status()
             
+            # Stop at the first abnormal tire; no statuses at all means there is nothing to report
+            tire_statuses = tire_info['statuses']
+            bad_tire = next((status for status in tire_statuses.values() if status and status != "NORMAL"), None)
+            if bad_tire:
+                tires = "Check Tire Status"
+            elif any(tire_statuses.values()):
+                tires = "All Normal"
+            else:
+                tires = "Not available"
+            
             # Create a readable summary
             summary = {
                 "vehicle_status": {
@@ -473,14 +653,415 @@ class FordPassAPI:
                     "latitude": location_info['latitude'],
                     "longitude": location_info['longitude']
                 },
-                "tires": "All Normal" if all(status == "NORMAL" for status in tire_info['statuses'].values() if status) else "Check Tire Status"
+                "tires": tires
             }
             
             return summary
         except Exception as e:
-            return f"Unable to retrieve status summary: {str(e)}"          
-def main():
-    """Main function with interactive menu"""
+            return f"Unable to retrieve status summary: {str(e)}"
+
+class FordPassAPI(_FordPassBase):
+    """FordPass client built on a pooled requests session"""
+    __slots__ = ("_owns_session", "_session")
+    
+    def __init__(self, username, password, vin, session=None):
+        super().__init__(username, password, vin)
+        
+        # HTTP session - reused for every call so the TLS connections to each host stay alive.
+        # The base headers live on the session, so each call only passes its own extras.
+        self._owns_session = session is None
+        self._session = session or self.create_session()
+        self._session.headers.update(self._base_headers())
+    
+    @staticmethod
+    def create_session():
+        """Create a pooled keep-alive HTTP session that retries transient failures at the HTTP layer"""
+        session = requests.Session()
+        # Status GETs can be repeated anywhere; vehicle commands are POSTs and are never re-sent
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_retry("GET")))
+        # Token requests are POSTs too, but repeating one only issues another token
+        auth_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_retry("GET", "POST"))
+        session.mount("https://us-central1-ford-connected-car.cloudfunctions.net", auth_adapter)
+        session.mount("https://accounts.autonomic.ai", auth_adapter)
+        return session
+    
+    def close(self):
+        """Close the HTTP session, unless it was passed in by the caller"""
+        if self._owns_session:
+            self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def get_ford_token(self):
+        """Get a one-shot FordPass authentication token for the Autonomic token exchange"""
+        try:
+            response = self._session.post(
+                self.ford_token_url,
+                headers={"Content-Type": "application/json"},
+                json=self._ford_auth_data(),
+                timeout=REQUEST_TIMEOUT
+            )
+            return self._read_ford_token(response)
+        except (requests.RequestException, ValueError) as e:
+            raise Exception(f"Ford token request failed: {str(e)}")
+    
+    def get_autonomic_token(self):
+        """Get the Autonomic token using the Ford token"""
+        token = self._cached_autonomic_token()
+        if token:
+            return token
+        
+        # Clients for other vehicles of the same account may be authenticating right now - wait for
+        # them and reuse the token they save instead of running a second login
+        with self.token_store.lock:
+            token = self._load_stored_token()
+            if token:
+                return token
+            
+            # The Ford token is only needed for this exchange, so it is fetched fresh and not kept
+            ford_token = self.get_ford_token()
+            
+            try:
+                # A dict is form-encoded and gets its Content-Type header automatically
+                response = self._session.post(
+                    self.autonomic_token_url,
+                    data=self._autonomic_auth_data(ford_token),
+                    timeout=REQUEST_TIMEOUT
+                )
+                token = self._store_autonomic_token(response)
+            except (requests.RequestException, ValueError) as e:
+                raise Exception(f"Autonomic token request failed: {str(e)}")
+            self.token_store.save(token, self.autonomic_token_expiration)
+            return token
+    
+    def get_auth_token(self):
+        """Get the final authentication token to use for API calls"""
+        return self.get_autonomic_token()
+    
+    def execute_command(self, command, retry_auth=True):
+        """Execute a command on the vehicle (lock, unlock, start, stop, etc.)"""
+        token = self.get_auth_token()
+        
+        # If command is 'status', use the status endpoint
+        if command == "status":
+            return self.get_vehicle_status()
+        
+        # For other commands, use the command endpoint
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        }
+        
+        try:
+            response = self._session.post(
+                self.command_endpoint,
+                headers=headers,
+                json={"command": command},
+                timeout=REQUEST_TIMEOUT
+            )
+        except requests.RequestException as e:
+            raise Exception(f"Command execution failed: {str(e)}")
+        
+        if response.status_code == 401 and retry_auth:
+            # Stored token was revoked - the command was rejected, so drop the token and send it once more
+            self._reset_tokens()
+            return self.execute_command(command, retry_auth=False)
+        
+        try:
+            return self._command_result(response)
+        except ValueError as e:
+            raise Exception(f"Command execution failed: {str(e)}")
+    
+    def get_vehicle_status(self, force=False, retry_auth=True):
+        """Get vehicle status information and save to file, reusing a response younger than status_ttl unless force is set"""
+        if not force and self._status_cache is not None and time.time() < self._status_cache_expiry:
+            return self._status_cache
+        
+        token = self.get_auth_token()
+        
+        headers = {"Authorization": f"Bearer {token}"}
+        
+        try:
+            response = self._session.get(
+                self.status_endpoint,
+                headers=headers,
+                timeout=REQUEST_TIMEOUT
+            )
+        except requests.RequestException as e:
+            raise Exception(f"Vehicle status request failed: {str(e)}")
+        
+        if response.status_code == 401 and retry_auth:
+            # Cached token was rejected - drop it and authenticate again once
+            self._reset_tokens()
+            return self.get_vehicle_status(force=True, retry_auth=False)
+        
+        try:
+            status_data = self._store_status(response)
+            self._save_status_file(response.content)
+            return status_data
+        except (OSError, ValueError) as e:
+            raise Exception(f"Vehicle status request failed: {str(e)}")
+    
+    def _reset_tokens(self):
+        """Forget all tokens, including the stored one unless another client has already replaced it"""
+        rejected = self.autonomic_token
+        self._forget_tokens()
+        self.token_store.discard(rejected)
+    
+    def _snapshot(self):
+        """Get the flattened metrics of the vehicle status"""
+        self.get_vehicle_status()
+        return self._snapshot_cache
+
+class AsyncFordPassAPI(_FordPassBase):
+    """
+    asyncio FordPass client built on httpx
+    
+    Network calls are coroutines with their own names (aget_vehicle_status(), aexecute_command(),
+    aget_status_summary(), ...). The section getters such as get_battery_status() stay synchronous
+    and read the last awaited status; once it is older than status_ttl they report an error
+    instead of serving stale data.
+    """
+    __slots__ = ("_client",)
+    
+    def __init__(self, username, password, vin):
+        if httpx is None:
+            raise ImportError("AsyncFordPassAPI needs httpx. Install it with: pip install httpx")
+        super().__init__(username, password, vin)
+        
+        options = {
+            "limits": httpx.Limits(max_keepalive_connections=8),
+            "timeout": httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+            "headers": self._base_headers()
+        }
+        try:
+            self._client = httpx.AsyncClient(http2=True, **options)
+        except ImportError:
+            # HTTP/2 support needs the h2 package - HTTP/1.1 keep-alive still works without it
+            self._client = httpx.AsyncClient(**options)
+    
+    async def aclose(self):
+        """Close the HTTP client"""
+        await self._client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+    
+    async def _in_thread(self, func, *args):
+        """Run blocking file I/O (token store, status file) in the default executor, off the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+    
+    async def _send(self, method, url, retry_post=False, **kwargs):
+        """Send a request with the same retry policy as FordPassAPI.create_session()"""
+        # GETs are always safe to repeat; POSTs only when retry_post says so (token requests, not commands)
+        repeatable = method == "GET" or retry_post
+        for attempt in range(RETRY_TOTAL + 1):
+            try:
+                response = await self._client.request(method, url, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                # The request never reached the server, so it can be sent again whatever it is
+                if attempt == RETRY_TOTAL:
+                    raise
+                delay = RETRY_BACKOFF * 2 ** attempt
+            except httpx.TransportError:
+                if attempt == RETRY_TOTAL or not repeatable:
+                    raise
+                delay = RETRY_BACKOFF * 2 ** attempt
+            else:
+                if attempt == RETRY_TOTAL or not repeatable or response.status_code not in RETRY_STATUSES:
+                    return response
+                delay = _retry_after(response) or RETRY_BACKOFF * 2 ** attempt
+            await asyncio.sleep(delay)
+    
+    async def _areset_tokens(self):
+        """Forget all tokens, including the stored one unless another client has already replaced it"""
+        rejected = self.autonomic_token
+        self._forget_tokens()
+        await self._in_thread(self.token_store.discard, rejected)
+    
+    async def aget_ford_token(self):
+        """Get a one-shot FordPass authentication token for the Autonomic token exchange"""
+        try:
+            response = await self._send(
+                "POST",
+                self.ford_token_url,
+                retry_post=True,
+                headers={"Content-Type": "application/json"},
+                json=self._ford_auth_data()
+            )
+            return self._read_ford_token(response)
+        except (httpx.HTTPError, ValueError) as e:
+            raise Exception(f"Ford token request failed: {str(e)}")
+    
+    async def aget_autonomic_token(self):
+        """Get the Autonomic token using the Ford token"""
+        token = self._cached_autonomic_token() or await self._in_thread(self._load_stored_token)
+        if token:
+            return token
+        
+        # The Ford token is only needed for this exchange, so it is fetched fresh and not kept
+        ford_token = await self.aget_ford_token()
+        
+        try:
+            response = await self._send(
+                "POST",
+                self.autonomic_token_url,
+                retry_post=True,
+                data=self._autonomic_auth_data(ford_token)
+            )
+            token = self._store_autonomic_token(response)
+        except (httpx.HTTPError, ValueError) as e:
+            raise Exception(f"Autonomic token request failed: {str(e)}")
+        await self._in_thread(self.token_store.save, token, self.autonomic_token_expiration)
+        return token
+    
+    async def aget_auth_token(self):
+        """Get the final authentication token to use for API calls"""
+        return await self.aget_autonomic_token()
+    
+    async def aexecute_command(self, command, retry_auth=True):
+        """Execute a command on the vehicle (lock, unlock, start, stop, etc.)"""
+        token = await self.aget_auth_token()
+        
+        # If command is 'status', use the status endpoint
+        if command == "status":
+            return await self.aget_vehicle_status()
+        
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        }
+        
+        try:
+            response = await self._send(
+                "POST",
+                self.command_endpoint,
+                headers=headers,
+                json={"command": command}
+            )
+        except httpx.HTTPError as e:
+            raise Exception(f"Command execution failed: {str(e)}")
+        
+        if response.status_code == 401 and retry_auth:
+            # Stored token was revoked - the command was rejected, so drop the token and send it once more
+            await self._areset_tokens()
+            return await self.aexecute_command(command, retry_auth=False)
+        
+        try:
+            return self._command_result(response)
+        except ValueError as e:
+            raise Exception(f"Command execution failed: {str(e)}")
+    
+    async def aget_vehicle_status(self, force=False, retry_auth=True):
+        """Get vehicle status information and save to file, reusing a response younger than status_ttl unless force is set"""
+        if not force and self._status_cache is not None and time.time() < self._status_cache_expiry:
+            return self._status_cache
+        
+        token = await self.aget_auth_token()
+        
+        try:
+            response = await self._send(
+                "GET",
+                self.status_endpoint,
+                headers={"Authorization": f"Bearer {token}"}
+            )
+        except httpx.HTTPError as e:
+            raise Exception(f"Vehicle status request failed: {str(e)}")
+        
+        if response.status_code == 401 and retry_auth:
+            # Cached token was rejected - drop it and authenticate again once
+            await self._areset_tokens()
+            return await self.aget_vehicle_status(force=True, retry_auth=False)
+        
+        try:
+            status_data = self._store_status(response)
+            await self._in_thread(self._save_status_file, response.content)
+            return status_data
+        except (OSError, ValueError) as e:
+            raise Exception(f"Vehicle status request failed: {str(e)}")
+    
+    async def aget_status_summary(self):
+        """Get a comprehensive summary of vehicle status"""
+        # Every section is read from the same telemetry response, so one fetch serves the whole summary
+        try:
+            await self.aget_vehicle_status()
+        except Exception as e:
+            return f"Unable to retrieve status summary: {str(e)}"
+        return self.get_status_summary()
+    
+    def _snapshot(self):
+        """Get the flattened metrics of the last fetched vehicle status, refusing to serve it once it is stale"""
+        if self._snapshot_cache is None or time.time() >= self._status_cache_expiry:
+            raise Exception("No current vehicle status - await aget_vehicle_status() first")
+        return self._snapshot_cache
+
+# Report sections for --query: name -> (heading, FordPassAPI method)
+QUERIES = {
+    "summary": ("Vehicle Status Summary", "get_status_summary"),
+    "mileage": ("Mileage", "get_mileage"),
+    "battery": ("Battery Status", "get_battery_status"),
+    "doors": ("Door Status", "get_door_status"),
+    "tires": ("Tire Status", "get_tire_status"),
+    "location": ("Vehicle Location", "get_location"),
+    "climate": ("Climate Information", "get_climate_status"),
+    "trip": ("Trip Information", "get_trip_info"),
+    "charging": ("EV Charging Status", "get_ev_charging_status"),
+    "windows": ("Window Status", "get_window_status"),
+    "vehicle": ("Vehicle Information", "get_vehicle_info"),
+    "warnings": ("Active Warning Indicators", "get_warning_indicators")
+}
+
+def _dumps(data):
+    """Serialize a report as indented JSON, with orjson when it is installed"""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2)
+
+def run_queries(argv):
+    """Print the requested report sections in one run, sharing a single status fetch"""
+    parser = argparse.ArgumentParser(description='Query FordPass vehicle status')
+    parser.add_argument('--username', '-u', help='FordPass username/email')
+    parser.add_argument('--password', '-p', help='FordPass password')
+    parser.add_argument('--vin', '-v', help='Vehicle identification number')
+    parser.add_argument('--query', '-q', default='summary',
+                        help=f'Comma-separated sections to report: {", ".join(QUERIES)} (default: summary)')
+    parser.add_argument('--json', action='store_true',
+                        help='Print all sections as one JSON object')
+    args = parser.parse_args(argv)
+    
+    # Credentials can also come from the same environment variables as battery_monitor.py
+    username = args.username or os.environ.get('FORDPASS_USERNAME')
+    password = args.password or os.environ.get('FORDPASS_PASSWORD')
+    vin = args.vin or os.environ.get('FORDPASS_VIN')
+    if not (username and password and vin):
+        parser.error("username, password and VIN are required (options or FORDPASS_* environment variables)")
+    
+    keys = [k.strip() for k in args.query.split(",") if k.strip()]
+    unknown = [k for k in keys if k not in QUERIES]
+    if unknown:
+        parser.error(f"unknown section(s): {', '.join(unknown)}")
+    
+    with FordPassAPI(username, password, vin) as ford:
+        # Sections read the cached status response, so this is one telemetry GET however many are asked for
+        results = {key: getattr(ford, QUERIES[key][1])() for key in keys}
+    
+    if args.json:
+        print(_dumps(results))
+        return
+    
+    for key, result in results.items():
+        print(f"\n{QUERIES[key][0]}:")
+        print(result if isinstance(result, str) else _dumps(result))
+
+def interactive_menu():
+    """Interactive menu"""
     print("FordPass API Python Implementation")
     print("==================================")
     
@@ -490,78 +1071,84 @@ def main():
     vin = input("Enter your vehicle VIN: ")
     
     # Create API instance
-    ford = FordPassAPI(username, password, vin)
-    
-    # Main menu
-    while True:
-        print("\nOptions:")
-        print("1. Get vehicle status summary")
-        print("2. Get current mileage")
-        print("3. Get battery status")
-        print("4. Get door and lock status")
-        print("5. Get tire status")
-        print("6. Get location")
-        print("7. Get climate information")
-        print("8. Get trip information")
-        print("9. Get EV charging status")
-        print("0. Exit")
-        
-        choice = input("\nEnter your choice (0-13): ")
+    with FordPassAPI(username, password, vin) as ford:
+        # Main menu
+        while True:
+            print("\nOptions:")
+            print("1. Get vehicle status summary")
+            print("2. Get current mileage")
+            print("3. Get battery status")
+            print("4. Get door and lock status")
+            print("5. Get tire status")
+            print("6. Get location")
+            print("7. Get climate information")
+            print("8. Get trip information")
+            print("9. Get EV charging status")
+            print("0. Exit")
         
-        try:
-            if choice == "1":
-                summary = ford.get_status_summary()
-                print("\nVehicle Status Summary:")
-                print(json.dumps(summary, indent=2))
+            choice = input("\nEnter your choice (0-13): ")
+        
+            try:
+                if choice == "1":
+                    summary = ford.get_status_summary()
+                    print("\nVehicle Status Summary:")
+                    print(json.dumps(summary, indent=2))
                 
-            elif choice == "2":
-                mileage = ford.get_mileage()
-                print(f"\n{mileage}")
+                elif choice == "2":
+                    mileage = ford.get_mileage()
+                    print(f"\n{mileage}")
                 
-            elif choice == "3":
-                battery = ford.get_battery_status()
-                print("\nBattery Status:")
-                print(json.dumps(battery, indent=2))
+                elif choice == "3":
+                    battery = ford.get_battery_status()
+                    print("\nBattery Status:")
+                    print(json.dumps(battery, indent=2))
                 
-            elif choice == "4":
-                doors = ford.get_door_status()
-                print("\nDoor Status:")
-                print(json.dumps(doors, indent=2))
+                elif choice == "4":
+                    doors = ford.get_door_status()
+                    print("\nDoor Status:")
+                    print(json.dumps(doors, indent=2))
                 
-            elif choice == "5":
-                tires = ford.get_tire_status()
-                print("\nTire Status:")
-                print(json.dumps(tires, indent=2))
+                elif choice == "5":
+                    tires = ford.get_tire_status()
+                    print("\nTire Status:")
+                    print(json.dumps(tires, indent=2))
                 
-            elif choice == "6":
-                location = ford.get_location()
-                print("\nVehicle Location:")
-                print(json.dumps(location, indent=2))
+                elif choice == "6":
+                    location = ford.get_location()
+                    print("\nVehicle Location:")
+                    print(json.dumps(location, indent=2))
                 
-            elif choice == "7":
-                climate = ford.get_climate_status()
-                print("\nClimate Information:")
-                print(json.dumps(climate, indent=2))
+                elif choice == "7":
+                    climate = ford.get_climate_status()
+                    print("\nClimate Information:")
+                    print(json.dumps(climate, indent=2))
                 
-            elif choice == "8":
-                trip = ford.get_trip_info()
-                print("\nTrip Information:")
-                print(json.dumps(trip, indent=2))
+                elif choice == "8":
+                    trip = ford.get_trip_info()
+                    print("\nTrip Information:")
+                    print(json.dumps(trip, indent=2))
                 
-            elif choice == "9":
-                charging = ford.get_ev_charging_status()
-                print("\nEV Charging Status:")
-                print(json.dumps(charging, indent=2))
+                elif choice == "9":
+                    charging = ford.get_ev_charging_status()
+                    print("\nEV Charging Status:")
+                    print(json.dumps(charging, indent=2))
               
-            elif choice == "0":
-                print("\nExiting...")
-                break
+                elif choice == "0":
+                    print("\nExiting...")
+                    break
                 
-            else:
-                print("\nInvalid choice. Please try again.")
+                else:
+                    print("\nInvalid choice. Please try again.")
                 
-        except Exception as e:
-            print(f"\nError: {str(e)}")
+            except Exception as e:
+                print(f"\nError: {str(e)}")
+
+def main():
+    """Main function - batch queries when arguments are given, otherwise the interactive menu"""
+    if sys.argv[1:]:
+        run_queries(sys.argv[1:])
+    else:
+        interactive_menu()
 
 if __name__ == "__main__":
     main()